@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import operator
+from dataclasses import dataclass, field
 from datetime import datetime, time
+from functools import cached_property, lru_cache
 from typing import Callable
 
 from homeassistant.components.sensor import (
@@ -15,7 +17,7 @@ from homeassistant.const import (
     AREA_SQUARE_METERS, TIME_SECONDS
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util, slugify
 
@@ -26,6 +28,9 @@ from .device import RoborockCoordinatedEntity, parse_datetime_time
 
 _LOGGER = logging.getLogger(__name__)
 
+_UTC = dt_util.UTC
+_fromtimestamp = datetime.fromtimestamp
+
 ATTR_ACTUAL_SPEED = "actual_speed"
 ATTR_AIR_QUALITY = "air_quality"
 ATTR_TVOC = "tvoc"
@@ -80,20 +85,50 @@ ATTR_CONSUMABLE_STATUS_FILTER_LEFT = "filter_left"
 ATTR_CONSUMABLE_STATUS_SENSOR_DIRTY_LEFT = "sensor_dirty_left"
 
 
+@lru_cache(maxsize=1440)
+def _dnd_time(hour: int, minute: int) -> time:
+    """Return the (cached) time of day for a DnD hour/minute pair."""
+    return time(hour=hour, minute=minute)
+
+
+def _dnd_timestamp(values: tuple[int, int]) -> float:
+    """Return the next occurrence of a DnD (hour, minute) pair as a timestamp."""
+    hour, minute = values
+    return parse_datetime_time(_dnd_time(hour, minute))
+
+
+def _identity(data):
+    """Return the data unchanged, used when a sensor has no parent key."""
+    return data
+
+
+def _mm2_to_m2(value: int) -> float:
+    """Convert an area reported in mm² to m²."""
+    return value / 1000000
+
+
 @dataclass
 class RoborockSensorDescription(SensorEntityDescription):
     """A class that describes sensor entities."""
     attributes: tuple = ()
-    parent_key: str = None
-    keys: list[str] = None
-    value: Callable = None
+    parent_key: str | None = None
+    keys: tuple[str, ...] | None = None
+    value: Callable | None = None
+    parent_getter: Callable = field(init=False, repr=False, compare=False)
+    value_getter: Callable = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the attribute getters used to resolve the sensor value."""
+        self.parent_getter = operator.attrgetter(self.parent_key) if self.parent_key else _identity
+        # With several keys attrgetter returns a tuple of the values in a single call
+        self.value_getter = operator.attrgetter(*self.keys) if self.keys else operator.attrgetter(self.key)
 
 
 VACUUM_SENSORS = {
     f"dnd_{ATTR_DND_START}": RoborockSensorDescription(
         key=ATTR_DND_START,
-        keys=[DNDTimerField.START_HOUR, DNDTimerField.START_MINUTE],
-        value=lambda values: parse_datetime_time(time(hour=values[0], minute=values[1])),
+        keys=(DNDTimerField.START_HOUR, DNDTimerField.START_MINUTE),
+        value=_dnd_timestamp,
         icon="mdi:minus-circle-off",
         name="DnD start",
         device_class=SensorDeviceClass.TIMESTAMP,
@@ -102,8 +137,8 @@ VACUUM_SENSORS = {
     ),
     f"dnd_{ATTR_DND_END}": RoborockSensorDescription(
         key=ATTR_DND_END,
-        keys=[DNDTimerField.END_HOUR, DNDTimerField.END_MINUTE],
-        value=lambda values: parse_datetime_time(time(hour=values[0], minute=values[1])),
+        keys=(DNDTimerField.END_HOUR, DNDTimerField.END_MINUTE),
+        value=_dnd_timestamp,
         icon="mdi:minus-circle-off",
         name="DnD end",
         device_class=SensorDeviceClass.TIMESTAMP,
@@ -138,7 +173,7 @@ VACUUM_SENSORS = {
     f"last_clean_{ATTR_LAST_CLEAN_AREA}": RoborockSensorDescription(
         native_unit_of_measurement=AREA_SQUARE_METERS,
         key=CleanRecordField.AREA,
-        value=lambda value: value / 1000000,
+        value=_mm2_to_m2,
         icon="mdi:texture-box",
         parent_key=RoborockDevicePropField.LAST_CLEAN_RECORD,
         name="Last clean area",
@@ -156,7 +191,7 @@ VACUUM_SENSORS = {
     f"current_{ATTR_LAST_CLEAN_AREA}": RoborockSensorDescription(
         native_unit_of_measurement=AREA_SQUARE_METERS,
         key=StatusField.CLEAN_AREA,
-        value=lambda value: value / 1000000,
+        value=_mm2_to_m2,
         icon="mdi:texture-box",
         parent_key=RoborockDevicePropField.STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -174,7 +209,7 @@ VACUUM_SENSORS = {
     f"clean_history_{ATTR_CLEAN_HISTORY_TOTAL_AREA}": RoborockSensorDescription(
         native_unit_of_measurement=AREA_SQUARE_METERS,
         key=CleanSummaryField.CLEAN_AREA,
-        value=lambda value: value / 1000000,
+        value=_mm2_to_m2,
         icon="mdi:texture-box",
         parent_key=RoborockDevicePropField.CLEAN_SUMMARY,
         name="Total clean area",
@@ -191,7 +226,7 @@ VACUUM_SENSORS = {
     ),
     f"clean_history_{ATTR_CLEAN_HISTORY_DUST_COLLECTION_COUNT}": RoborockSensorDescription(
         native_unit_of_measurement="",
-        key=CleanSummaryField.CLEAN_COUNT,
+        key=CleanSummaryField.DUST_COLLECTION_COUNT,
         icon="mdi:counter",
         state_class=SensorStateClass.TOTAL_INCREASING,
         parent_key=RoborockDevicePropField.CLEAN_SUMMARY,
@@ -236,6 +271,8 @@ VACUUM_SENSORS = {
     ),
 }
 
+_VACUUM_SENSORS_ITEMS: tuple[tuple[str, RoborockSensorDescription], ...] = tuple(VACUUM_SENSORS.items())
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -248,17 +285,24 @@ async def async_setup_entry(
 
     for device_id, device_info in coordinator.api.device_map.items():
         unique_id = slugify(device_id)
-        for sensor, description in VACUUM_SENSORS.items():
-            parent_key_data = getattr(coordinator.data.get(device_id), description.parent_key)
+        device_data = coordinator.data.get(device_id)
+        product_model = device_info.product.model
+        for sensor, description in _VACUUM_SENSORS_ITEMS:
+            parent_key_data = description.parent_getter(device_data)
             if not parent_key_data:
                 _LOGGER.debug(
                     "It seems the %s does not support the %s as the initial value is None",
-                    device_info.product.model,
+                    product_model,
                     description.key,
                 )
                 continue
+            sensor_class = (
+                RoborockTimestampSensor
+                if description.device_class == SensorDeviceClass.TIMESTAMP
+                else RoborockSensor
+            )
             entities.append(
-                RoborockSensor(
+                sensor_class(
                     f"{sensor}_{unique_id}",
                     device_info,
                     coordinator,
@@ -280,18 +324,23 @@ class RoborockSensor(RoborockCoordinatedEntity, SensorEntity):
         SensorEntity.__init__(self)
         RoborockCoordinatedEntity.__init__(self, device_info, coordinator, unique_id)
         self.entity_description = description
+        self._getter = description.parent_getter
+        self._value_getter = description.value_getter
+        self._value_fn = description.value
         self._attr_native_value = self._determine_native_value()
+        # Attributes are static per entity, so they are only extracted once
         self._attr_extra_state_attributes = self._extract_attributes(coordinator.data.get(self._device_id))
+        self._last_available = self.available
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info, built once per entity."""
+        return super().device_info
 
     @callback
     def _extract_attributes(self, data):
         """Return state attributes with valid values."""
-        value = None
-        return {
-            attr: value
-            for attr in self.entity_description.attributes
-            if hasattr(data, attr)
-        }
+        return {attr: None for attr in self.entity_description.attributes if hasattr(data, attr)}
 
     @callback
     def _handle_coordinator_update(self):
@@ -299,33 +348,43 @@ class RoborockSensor(RoborockCoordinatedEntity, SensorEntity):
         native_value = self._determine_native_value()
         # Sometimes (quite rarely) the device returns None as the sensor value so we
         # check that the value: before updating the state.
-        if native_value:
-            data = self.coordinator.data.get(self._device_id)
-            self._attr_native_value = native_value
-            self._attr_extra_state_attributes = self._extract_attributes(data)
-            self.async_write_ha_state()
+        if native_value is None:
+            return
+        # Nothing changed since the last write, skip the state machine round-trip.
+        # Availability is tracked too so that failed updates still mark the entity unavailable.
+        available = self.available
+        if native_value == self._attr_native_value and available == self._last_available:
+            return
+        self._attr_native_value = native_value
+        self._last_available = available
+        self.async_write_ha_state()
 
     def _determine_native_value(self):
         """Determine native value."""
         data = self.coordinator.data.get(self._device_id)
-        if self.entity_description.parent_key:
-            data = getattr(data, self.entity_description.parent_key)
-
-        if self.entity_description.keys:
-            native_value = [
-                getattr(data, key) for key in self.entity_description.keys
-            ]
-        else:
-            native_value = getattr(data, self.entity_description.key)
-
-        if self.entity_description.value and native_value:
-            native_value = self.entity_description.value(native_value)
-
-        if (
-                self.device_class == SensorDeviceClass.TIMESTAMP
-                and native_value
-                and (native_datetime := datetime.fromtimestamp(native_value))
-        ):
-            return native_datetime.astimezone(dt_util.UTC)
+        if data is None or (data := self._getter(data)) is None:
+            return None
+        native_value = self._value_getter(data)
+
+        if (value_fn := self._value_fn) and native_value:
+            native_value = value_fn(native_value)
 
         return native_value
+
+
+class RoborockTimestampSensor(RoborockSensor):
+    """Representation of a Roborock sensor reporting a timestamp."""
+
+    _ts_cache_in = None
+    _ts_cache_out = None
+
+    def _determine_native_value(self):
+        """Determine native value as a UTC datetime."""
+        native_value = super()._determine_native_value()
+        if not native_value:
+            return native_value
+        # Timestamps rarely change between updates, reuse the last conversion
+        if native_value != self._ts_cache_in:
+            self._ts_cache_in = native_value
+            self._ts_cache_out = _fromtimestamp(native_value, tz=_UTC)
+        return self._ts_cache_out